@@ -12,7 +12,14 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
 from .client_adapter import SkellyClientAdapter
-from .const import CONF_SERVER_URL, CONF_USE_BLE_PROXY, DEFAULT_SERVER_URL, DOMAIN
+from .const import (
+    CONF_SCAN_INTERVAL,
+    CONF_SERVER_URL,
+    CONF_USE_BLE_PROXY,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SERVER_URL,
+    DOMAIN,
+)
 from .coordinator import SkellyCoordinator
 from .helpers import DeviceLoggerAdapter, get_device_info, get_device_name
 from .services import register_services, unregister_services
@@ -126,12 +133,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if len(hass.data[DOMAIN]) == 1:
         register_services(hass)
 
+    # Apply option changes (e.g. the polling interval) without a reload, since
+    # the connection switches also store their state in the entry options
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
     # Forward setup to entity platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated config-entry options to the running coordinator."""
+    data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if data is None:
+        return
+    data["coordinator"].set_scan_interval(
+        entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry and disconnect the adapter."""
     if entry.entry_id not in hass.data.get(DOMAIN, {}):
@@ -6,6 +6,7 @@ This keeps the HA integration code separate from the library internals.
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 import logging
 
 from bleak import BleakClient
@@ -17,11 +18,24 @@ from bleak_retry_connector import (
 from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant
 
+from .skelly_ultra_pkg import parser
 from .skelly_ultra_pkg.client import SkellyClient
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class SkellyStatus:
+    """Device state collected by a single status bundle query."""
+
+    live_mode: parser.LiveModeEvent
+    device_params: parser.DeviceParamsEvent
+    volume: int
+    live_name: str
+    capacity: parser.CapacityEvent
+    file_order: list[int]
+
+
 class SkellyClientAdapter:
     """Adapter that manages a SkellyClient and integrates with Home Assistant's BLE helpers.
 
@@ -54,6 +68,7 @@ class SkellyClientAdapter:
         self._logger = logger or _LOGGER
         self._live_mode_callbacks: list = []
         self._live_mode_should_connect = live_mode_should_connect
+        self._status_lock = asyncio.Lock()
 
     def register_live_mode_callback(self, callback) -> None:
         """Register a callback to be notified when live mode connection state changes."""
@@ -290,6 +305,60 @@ class SkellyClientAdapter:
         except Exception:
             self._logger.exception("Error while disconnecting Skelly client")
 
+    @property
+    def status_query_in_progress(self) -> bool:
+        """Return True while a status bundle is being queried."""
+        return self._status_lock.locked()
+
+    async def get_status_bundle(
+        self, device_params: parser.DeviceParamsEvent | None = None
+    ) -> SkellyStatus:
+        """Query the full device status as one batch.
+
+        The firmware has no compound status command, so the individual queries
+        are pipelined: the client paces the sends and routes every response to
+        its own waiter, which lets the round trips overlap. The lock keeps two
+        bundles from being queried at the same time.
+
+        The individual queries start no timers of their own; the caller is
+        expected to bound the whole bundle with a single deadline.
+
+        Args:
+            device_params: Device parameters the caller has already read; when
+                given they are reused instead of being queried again
+        """
+        client = self._client
+        async with self._status_lock:
+            if device_params is None:
+                device_params_query = client.get_device_params(timeout=None)
+            else:
+                device_params_query = asyncio.get_running_loop().create_future()
+                device_params_query.set_result(device_params)
+            (
+                live_mode,
+                device_params,
+                volume,
+                live_name,
+                capacity,
+                file_order,
+            ) = await asyncio.gather(
+                client.get_live_mode(timeout=None),
+                device_params_query,
+                client.get_volume(timeout=None),
+                client.get_live_name(timeout=None),
+                client.get_capacity(timeout=None),
+                client.get_file_order(timeout=None),
+            )
+
+        return SkellyStatus(
+            live_mode=live_mode,
+            device_params=device_params,
+            volume=volume,
+            live_name=live_name,
+            capacity=capacity,
+            file_order=file_order,
+        )
+
     @property
     def client(self) -> SkellyClient:
         """Return the underlying SkellyClient instance."""
@@ -7,28 +7,120 @@ integration via Home Assistant's UI.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import re
+import time
 from typing import Any
 
 import aiohttp
 import voluptuous as vol
-from bleak import BleakScanner
 
 from homeassistant import config_entries
 from homeassistant.components import bluetooth
 from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
+from homeassistant.util.json import json_loads
 
 from .const import (
+    CONF_SCAN_INTERVAL,
     CONF_SERVER_URL,
     CONF_USE_BLE_PROXY,
+    DEFAULT_SCAN_INTERVAL,
     DEFAULT_SERVER_URL,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
 )
 from .helpers import build_device_identifier
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_DEVICE_NAME = "Skelly Ultra"
+
 SHOW_ALL_TOKEN = "__show_all__"
+_SHOW_ALL_ENTRY: dict[str, str] = {SHOW_ALL_TOKEN: "Show all devices"}
+
+# Product name advertised by Skelly devices and a precompiled
+# case-insensitive matcher for it
+_SKELLY_NAME = "Animated Skelly"
+_SKELLY_RE = re.compile(re.escape(_SKELLY_NAME), re.IGNORECASE)
+
+# Static choices offered by the flow forms
+_MODE_CHOICES = ("manual", "scan")
+_ACTION_CHOICES = ("retry", "show_all", "manual")
+
+# Fallback form shown when a scan finds nothing
+_ACTION_SCHEMA = vol.Schema(
+    {vol.Required("action", default="retry"): vol.In(_ACTION_CHOICES)}
+)
+
+# The health check should answer quickly; fail fast on unreachable hosts
+_HEALTH_CHECK_TIMEOUT = aiohttp.ClientTimeout(total=2.0, connect=0.5, sock_read=1.5)
+
+# Static query parameters and headers for REST server scans. The client
+# timeout is derived from the server-side scan duration so the two don't
+# stack, and connection failures are detected within a second.
+_SCAN_SERVER_TIMEOUT = 10.0
+_SCAN_PARAMS: tuple[tuple[str, str], ...] = (("timeout", str(_SCAN_SERVER_TIMEOUT)),)
+_SCAN_TIMEOUT = aiohttp.ClientTimeout(
+    total=_SCAN_SERVER_TIMEOUT + 3.0,
+    connect=1.0,
+    sock_connect=1.0,
+    sock_read=_SCAN_SERVER_TIMEOUT + 2.0,
+)
+_JSON_HEADERS = {"Accept": "application/json"}
+
+# How long to wait for the optional REST server check in direct mode
+_DIRECT_PROBE_TIMEOUT = 1.5
+
+# How long the results of a local scan can be reused for show_all
+_SCAN_REUSE_SECONDS = 30.0
+
+
+def _normalize_server_url(url: str) -> str:
+    """Return the REST server URL without trailing slashes."""
+    return url.rstrip("/")
+
+
+def _derive_device_name(user_input: dict[str, Any]) -> str:
+    """Return the manually entered device name or the default name."""
+    return (user_input.get(CONF_NAME) or "").strip() or _DEFAULT_DEVICE_NAME
+
+
+def _device_name_from_display(display: str) -> str:
+    """Extract the device name from a "Name (Address)" choice label."""
+    name, sep, _ = display.partition(" (")
+    return name if sep and display.endswith(")") else _DEFAULT_DEVICE_NAME
+
+
+def _address_schema(choices: dict[str, str]) -> vol.Schema:
+    """Build the device selection schema for the given address->label choices.
+
+    The options are serialized once into a dropdown selector, which keeps
+    explicit labels and rejects addresses that weren't offered.
+    """
+    options = [
+        SelectOptionDict(value=addr, label=label) for addr, label in choices.items()
+    ]
+    return vol.Schema(
+        {
+            vol.Required(CONF_ADDRESS): SelectSelector(
+                SelectSelectorConfig(options=options, mode=SelectSelectorMode.DROPDOWN)
+            )
+        }
+    )
 
 
 class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -36,36 +128,125 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> SkellyOptionsFlow:
+        """Return the options flow for this handler."""
+        return SkellyOptionsFlow()
+
     def __init__(self) -> None:
         """Initialize flow state."""
         self._discovered: dict[str, str] = {}
         self._server_url: str = DEFAULT_SERVER_URL
         self._use_ble_proxy: bool = False
         self._user_input: dict[str, Any] | None = None
+        # (monotonic time, unfiltered devices) from the last local scan
+        self._scan_cache: tuple[float, list[Any]] | None = None
+        self._has_bluetooth: bool = False
 
     async def _validate_rest_server(self, server_url: str) -> dict[str, str] | None:
         """Validate the REST server is accessible.
 
         Returns None if valid, or a dict with error key if invalid.
         """
+        session = async_get_clientsession(self.hass)
+        url = f"{server_url}/health"
         try:
-            timeout = aiohttp.ClientTimeout(total=5.0)
-            async with (
-                aiohttp.ClientSession(timeout=timeout) as session,
-                session.get(f"{server_url}/health") as resp,
-            ):
-                if resp.status == 200:
-                    # Server is accessible
-                    return None
-                _LOGGER.warning("REST server returned status %d", resp.status)
-                return {"base": "rest_server_error"}
+            # HEAD avoids downloading the body; aiohttp servers answer it for
+            # every GET route, but fall back to GET for servers that don't
+            async with session.head(url, timeout=_HEALTH_CHECK_TIMEOUT) as resp:
+                status = resp.status
+            if status == 405:
+                async with session.get(url, timeout=_HEALTH_CHECK_TIMEOUT) as resp:
+                    status = resp.status
+            if status == 200:
+                # Server is accessible
+                return None
+            _LOGGER.warning("REST server returned status %d", status)
+            return {"base": "rest_server_error"}
         except aiohttp.ClientConnectorError:
             _LOGGER.warning("Cannot connect to REST server at %s", server_url)
             return {"base": "rest_server_unreachable"}
+        except TimeoutError:
+            _LOGGER.warning("Timed out checking REST server at %s", server_url)
+            return {"base": "rest_server_timeout"}
         except Exception:
             _LOGGER.exception("Error validating REST server")
             return {"base": "rest_server_error"}
 
+    def _bluetooth_available(self) -> bool:
+        """Return True if the bluetooth integration is configured.
+
+        A positive result is cached for the lifetime of the flow; a negative
+        one is re-checked so the user can add the integration and retry.
+        """
+        if not self._has_bluetooth:
+            self._has_bluetooth = bool(
+                self.hass.config_entries.async_entries("bluetooth")
+            )
+        return self._has_bluetooth
+
+    def _find_known_skelly(self) -> bluetooth.BluetoothServiceInfoBleak | None:
+        """Return a Skelly already discovered by Home Assistant, if any."""
+        for service_info in bluetooth.async_discovered_service_info(
+            self.hass, connectable=False
+        ):
+            if service_info.name and _SKELLY_RE.search(service_info.name):
+                return service_info
+        return None
+
+    async def _async_wait_for_skelly(self, timeout: float = 5.0) -> None:
+        """Wait until a Skelly advertisement is seen or the timeout expires.
+
+        Registering the callback replays advertisements already known to Home
+        Assistant, so this returns immediately when a Skelly is in range.
+        """
+        found = asyncio.Event()
+
+        @callback
+        def _async_discovered(
+            service_info: bluetooth.BluetoothServiceInfoBleak,
+            change: bluetooth.BluetoothChange,
+        ) -> None:
+            if service_info.name and _SKELLY_RE.search(service_info.name):
+                found.set()
+
+        cancel = bluetooth.async_register_callback(
+            self.hass,
+            _async_discovered,
+            {"connectable": False},
+            bluetooth.BluetoothScanningMode.ACTIVE,
+        )
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(found.wait(), timeout=timeout)
+        finally:
+            cancel()
+
+    def _create_entry(self, address: str, device_name: str):
+        """Create the config entry for the given device."""
+        # Build consistent title using helper
+        title = build_device_identifier(
+            device_name, address, self._server_url if self._use_ble_proxy else None
+        )
+        return self.async_create_entry(
+            title=title,
+            data={
+                CONF_ADDRESS: address,
+                CONF_NAME: device_name,
+                CONF_SERVER_URL: self._server_url,
+                CONF_USE_BLE_PROXY: self._use_ble_proxy,
+            },
+        )
+
+    def _create_manual_entry(self, user_input: dict[str, Any]):
+        """Create the config entry from manually entered form data."""
+        return self._create_entry(
+            user_input.get(CONF_ADDRESS, ""), _derive_device_name(user_input)
+        )
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Initial step offering manual entry or discovery.
 
@@ -79,39 +260,74 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         # Build form schema - both modes now support scan or manual
         use_proxy = user_input.get(CONF_USE_BLE_PROXY, False) if user_input else False
 
+        # Pre-fill the form when Home Assistant has already seen a Skelly so the
+        # user can submit it directly without waiting for a scan
+        mode_default = "scan"
+        address_default = ""
+        name_default = "Animated Skelly"
+        if user_input is None and self._bluetooth_available():
+            known = self._find_known_skelly()
+            if known is not None:
+                _LOGGER.debug("Pre-filling form with known device %s", known.address)
+                mode_default = "manual"
+                address_default = known.address
+                name_default = known.name
+
         # Both modes: show mode selector
         schema = vol.Schema(
             {
                 vol.Required(CONF_USE_BLE_PROXY, default=use_proxy): bool,
-                vol.Required("mode", default="scan"): vol.In(["manual", "scan"]),
-                vol.Optional(CONF_ADDRESS, default=""): str,
-                vol.Optional(CONF_NAME, default="Animated Skelly"): str,
+                vol.Required("mode", default=mode_default): vol.In(_MODE_CHOICES),
+                vol.Optional(CONF_ADDRESS, default=address_default): str,
+                vol.Optional(CONF_NAME, default=name_default): str,
                 vol.Required(CONF_SERVER_URL, default=DEFAULT_SERVER_URL): str,
             }
         )
 
         # In direct mode (not proxy), require that the user has a bluetooth config entry
-        if not use_proxy:
-            bt_entries = self.hass.config_entries.async_entries("bluetooth")
-            if not bt_entries:
-                # Show the same form but with an error explaining bluetooth is
-                # required so the user can take action in the UI.
-                return self.async_show_form(
-                    step_id="user",
-                    data_schema=schema,
-                    errors={"base": "bluetooth_integration_required"},
-                )
+        if not use_proxy and not self._bluetooth_available():
+            # Show the same form but with an error explaining bluetooth is
+            # required so the user can take action in the UI.
+            return self.async_show_form(
+                step_id="user",
+                data_schema=schema,
+                errors={"base": "bluetooth_integration_required"},
+            )
 
         if user_input is None:
             return self.async_show_form(step_id="user", data_schema=schema)
 
-        # Validate the REST server is accessible (required for proxy mode, optional for direct mode)
         use_ble_proxy = user_input.get(CONF_USE_BLE_PROXY, False)
-        server_url = user_input.get(CONF_SERVER_URL, DEFAULT_SERVER_URL).rstrip("/")
-        server_errors = await self._validate_rest_server(server_url)
+        mode = user_input.get("mode", "manual")
+        server_url = _normalize_server_url(
+            user_input.get(CONF_SERVER_URL, DEFAULT_SERVER_URL)
+        )
+
+        # Validate the REST server is accessible (required for proxy mode, optional
+        # for direct mode). Manual entry in direct mode doesn't use the server during
+        # setup, so skip the probe there; runtime reports an unreachable server.
+        server_errors: dict[str, str] | None = None
+        if use_ble_proxy:
+            server_errors = await self._validate_rest_server(server_url)
+        elif mode == "scan":
+            # The server is optional in direct mode, so don't let a slow server
+            # block the step. An unfinished probe keeps running in the background
+            # and logs its own warning if the server turns out to be unreachable.
+            probe_task = self.hass.async_create_task(
+                self._validate_rest_server(server_url)
+            )
+            done, _ = await asyncio.wait({probe_task}, timeout=_DIRECT_PROBE_TIMEOUT)
+            server_errors = probe_task.result() if done else None
+            if not done:
+                _LOGGER.debug(
+                    "REST server at %s did not answer within %.1fs, continuing",
+                    server_url,
+                    _DIRECT_PROBE_TIMEOUT,
+                )
 
-        # Store user input for later use
-        self._user_input = user_input
+        # Store user input for later use, with the URL already canonicalized so
+        # later steps never need to normalize it again
+        self._user_input = {**user_input, CONF_SERVER_URL: server_url}
         self._server_url = server_url
         self._use_ble_proxy = use_ble_proxy
 
@@ -129,7 +345,6 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_server_warning()
 
         # Check mode selector (both direct and proxy modes support scan now)
-        mode = user_input.get("mode", "manual")
         if mode == "scan":
             return await self.async_step_scan()
 
@@ -142,20 +357,7 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 errors={"base": "address_required"},
             )
 
-        device_name = user_input.get(CONF_NAME) or "Skelly Ultra"
-        # Build consistent title using helper
-        title = build_device_identifier(
-            device_name, address, server_url if use_ble_proxy else None
-        )
-        return self.async_create_entry(
-            title=title,
-            data={
-                CONF_ADDRESS: address,
-                CONF_NAME: device_name,
-                CONF_SERVER_URL: server_url,
-                CONF_USE_BLE_PROXY: use_ble_proxy,
-            },
-        )
+        return self._create_manual_entry(self._user_input)
 
     async def async_step_server_warning(self, user_input: dict[str, Any] | None = None):
         """Show warning about REST server not being available.
@@ -173,21 +375,7 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_scan()
 
             # Manual mode: create entry directly
-            address = self._user_input.get(CONF_ADDRESS, "")
-            device_name = self._user_input.get(CONF_NAME) or "Skelly Ultra"
-            # Build consistent title using helper
-            title = build_device_identifier(
-                device_name, address, self._server_url if self._use_ble_proxy else None
-            )
-            return self.async_create_entry(
-                title=title,
-                data={
-                    CONF_ADDRESS: address,
-                    CONF_NAME: device_name,
-                    CONF_SERVER_URL: self._server_url,
-                    CONF_USE_BLE_PROXY: self._use_ble_proxy,
-                },
-            )
+            return self._create_manual_entry(self._user_input)
 
         # Show warning form with link to documentation
         # Note: Empty schemas don't display descriptions in Home Assistant,
@@ -212,39 +400,133 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         Returns list of devices with 'name' and 'address' keys.
         """
         try:
-            timeout = aiohttp.ClientTimeout(total=15.0)
-            params = {"timeout": "10.0"}
+            params = _SCAN_PARAMS
             if name_filter:
-                params["name_filter"] = name_filter
-
-            async with (
-                aiohttp.ClientSession(timeout=timeout) as session,
-                session.get(
-                    f"{self._server_url}/ble/scan_devices", params=params
-                ) as resp,
-            ):
+                params = (*_SCAN_PARAMS, ("name_filter", name_filter))
+
+            # Share Home Assistant's session so the health check and scans in
+            # one flow reuse the same keep-alive connection to the server
+            session = async_get_clientsession(self.hass)
+            async with session.get(
+                f"{self._server_url}/ble/scan_devices",
+                params=params,
+                headers=_JSON_HEADERS,
+                timeout=_SCAN_TIMEOUT,
+            ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    # Scan results can list many devices; decode with HA's
+                    # orjson-backed loader instead of the stdlib json module
+                    data = await resp.json(loads=json_loads)
                     if data.get("success"):
                         return data.get("devices", [])
                     _LOGGER.warning("REST server scan failed: %s", data.get("error"))
                     return []
                 _LOGGER.warning("REST server scan returned status %d", resp.status)
                 return []
+        except TimeoutError:
+            _LOGGER.warning("Timed out scanning via REST server %s", self._server_url)
+            return []
         except Exception:
             _LOGGER.exception("Error scanning via REST server")
             return []
 
+    async def _async_discover_local(self, filtered: bool) -> list[Any]:
+        """Discover nearby BLE devices.
+
+        Home Assistant's shared scanner continuously collects advertisements,
+        so devices are read from its cache instead of starting a new scan. A
+        filtered scan first waits until a Skelly advertisement is seen (or the
+        timeout expires). An unfiltered (show_all) scan reuses the previous
+        scan's devices when they are recent enough.
+        """
+        if (
+            not filtered
+            and self._scan_cache is not None
+            and time.monotonic() - self._scan_cache[0] < _SCAN_REUSE_SECONDS
+        ):
+            _LOGGER.debug(
+                "Reusing %d devices from previous scan", len(self._scan_cache[1])
+            )
+            return self._scan_cache[1]
+
+        if filtered:
+            await self._async_wait_for_skelly(timeout=5.0)
+        devices: list[Any] = list(
+            bluetooth.async_discovered_service_info(self.hass, connectable=False)
+        )
+        _LOGGER.debug(
+            "HA bluetooth cache has %d devices (filtered=%s)", len(devices), filtered
+        )
+
+        # Only scan with Bleak directly as a last resort when HA hasn't seen any
+        # device at all, to avoid contending with HA's scanner for the adapter.
+        if not devices:
+            try:
+                _LOGGER.debug(
+                    "HA reports no devices; falling back to BleakScanner.discover()"
+                )
+                # Imported lazily since this fallback is rarely needed
+                from bleak import BleakScanner
+
+                devices = await BleakScanner.discover(timeout=5.0)
+            except (TimeoutError, OSError):
+                devices = []
+
+        self._scan_cache = (time.monotonic(), devices)
+        return devices
+
+    async def _async_show_all(self):
+        """Perform an unfiltered scan and present all devices."""
+        if self._use_ble_proxy:
+            # Scan via REST server without filter
+            _LOGGER.debug("Scanning via REST server (proxy mode, show_all)")
+            rest_devices = await self._scan_via_rest_server(name_filter=None)
+            _LOGGER.debug(
+                "REST server returned %d devices (show_all)", len(rest_devices)
+            )
+
+            choices = {
+                addr: (
+                    f"{d['name']} ({addr})"
+                    if d.get("name") not in (None, "", "Unknown")
+                    else addr
+                )
+                for d in rest_devices
+                if (addr := d.get("address"))
+            }
+        else:
+            # Local BLE scan without filter, reusing a recent scan if possible
+            devices = await self._async_discover_local(filtered=False)
+
+            # Use friendly label when name present, otherwise show
+            # only the address so the UI doesn't display 'Unknown'.
+            choices = {
+                addr: (f"{d.name} ({addr})" if d.name else addr)
+                for d in devices
+                if (addr := d.address)
+            }
+
+        self._discovered = choices
+        _LOGGER.debug("show_all choices populated: %s", choices)
+        if not choices:
+            return self.async_show_form(
+                step_id="scan",
+                data_schema=_ACTION_SCHEMA,
+                errors={"base": "no_devices_found"},
+            )
+
+        return self.async_show_form(
+            step_id="scan", data_schema=_address_schema(choices)
+        )
+
     async def async_step_scan(self, user_input: dict[str, Any] | None = None):
         """Scan for nearby BLE devices and present a selection list."""
         _LOGGER.debug("async_step_scan called, user_input=%s", user_input)
 
         # In direct BLE mode, require bluetooth integration
         # In proxy mode, we'll scan via the REST server instead
-        if not self._use_ble_proxy:
-            bt_entries = self.hass.config_entries.async_entries("bluetooth")
-            if not bt_entries:
-                return self.async_abort(reason="bluetooth_integration_required")
+        if not self._use_ble_proxy and not self._bluetooth_available():
+            return self.async_abort(reason="bluetooth_integration_required")
         # If the user submitted an action from the fallback form, handle it
         if user_input is not None and "action" in user_input:
             action = user_input.get("action")
@@ -252,77 +534,7 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 # retry the filtered scan
                 return await self.async_step_scan()
             if action == "show_all":
-                # Perform an unfiltered scan and present all devices
-                choices: dict[str, str] = {}
-
-                if self._use_ble_proxy:
-                    # Scan via REST server without filter
-                    _LOGGER.debug("Scanning via REST server (proxy mode, show_all)")
-                    rest_devices = await self._scan_via_rest_server(name_filter=None)
-                    _LOGGER.debug(
-                        "REST server returned %d devices (show_all)", len(rest_devices)
-                    )
-
-                    for d in rest_devices:
-                        addr = d.get("address")
-                        if not addr:
-                            continue
-                        name = d.get("name", "Unknown")
-                        display = (
-                            f"{name} ({addr})" if name and name != "Unknown" else addr
-                        )
-                        choices[addr] = display
-                else:
-                    # Local BLE scan without filter
-                    devices = []
-                    try:
-                        scanner = bluetooth.async_get_scanner(self.hass)
-                        devices = await scanner.discover(timeout=5.0)
-                    except (TimeoutError, OSError):
-                        devices = []
-                    _LOGGER.debug(
-                        "HA scanner returned %d devices (show_all)", len(devices)
-                    )
-
-                    # If HA's shared scanner returned nothing, fall back to calling
-                    # Bleak directly. This helps when the shared scanner isn't
-                    # reporting devices even though BLE hardware can see them.
-                    if not devices:
-                        try:
-                            _LOGGER.debug(
-                                "HA scanner returned no devices; falling back to BleakScanner.discover()"
-                            )
-                            devices = await BleakScanner.discover(timeout=5.0)
-                        except (TimeoutError, OSError):
-                            devices = []
-
-                    for d in devices:
-                        addr = getattr(d, "address", None)
-                        if not addr:
-                            continue
-                        name = getattr(d, "name", None)
-                        # Use friendly label when name present, otherwise show
-                        # only the address so the UI doesn't display 'Unknown'.
-                        display = f"{name} ({addr})" if name else addr
-                        choices[addr] = display
-
-                self._discovered = choices
-                _LOGGER.debug("show_all choices populated: %s", choices)
-                if not choices:
-                    return self.async_show_form(
-                        step_id="scan",
-                        data_schema=vol.Schema(
-                            {
-                                vol.Required("action", default="retry"): vol.In(
-                                    ["retry", "show_all", "manual"]
-                                )
-                            }
-                        ),
-                        errors={"base": "no_devices_found"},
-                    )
-
-                schema = vol.Schema({vol.Required(CONF_ADDRESS): vol.In(choices)})
-                return self.async_show_form(step_id="scan", data_schema=schema)
+                return await self._async_show_all()
 
             if action == "manual":
                 # jump back to the manual entry form
@@ -336,83 +548,59 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 # Scan via REST server with name filter
                 _LOGGER.debug("Scanning via REST server (proxy mode)")
                 rest_devices = await self._scan_via_rest_server(
-                    name_filter="Animated Skelly"
+                    name_filter=_SKELLY_NAME
                 )
                 _LOGGER.debug(
                     "REST server returned %d devices (filtered)", len(rest_devices)
                 )
 
-                for d in rest_devices:
-                    addr = d.get("address")
-                    name = d.get("name", "Unknown")
-                    if addr:
-                        display = f"{name} ({addr})"
-                        choices[addr] = display
+                choices = {
+                    addr: f"{d.get('name', 'Unknown')} ({addr})"
+                    for d in rest_devices
+                    if (addr := d.get("address"))
+                }
             else:
                 # Local BLE scan with filtering
-                devices = []
-                try:
-                    scanner = bluetooth.async_get_scanner(self.hass)
-                    devices = await scanner.discover(timeout=5.0)
-                except (TimeoutError, OSError):
-                    devices = []
-
-                _LOGGER.debug("Scanner discovered %d devices (initial)", len(devices))
-
-                # If HA's shared scanner returned nothing, fall back to Bleak
-                if not devices:
-                    try:
-                        _LOGGER.debug(
-                            "HA scanner returned no devices during filtered scan; falling back to BleakScanner.discover()"
-                        )
-                        devices = await BleakScanner.discover(timeout=5.0)
-                    except (TimeoutError, OSError):
-                        devices = []
+                devices = await self._async_discover_local(filtered=True)
 
-                for d in devices:
+                # Evaluate once so per-device logging costs nothing when debug
+                # logging is disabled
+                debug = _LOGGER.isEnabledFor(logging.DEBUG)
+                if debug:
                     _LOGGER.debug(
-                        "discovered device: address=%s name=%s",
-                        getattr(d, "address", None),
-                        getattr(d, "name", None),
+                        "Scanner discovered %d devices after fallback (filtered): %s",
+                        len(devices),
+                        [(d.address, d.name) for d in devices],
                     )
 
-                _LOGGER.debug(
-                    "Scanner discovered %d devices after fallback (filtered)",
-                    len(devices),
-                )
-
                 for d in devices:
+                    addr = d.address
+                    # Skip repeated advertisements from a device already listed
+                    if addr in choices:
+                        continue
+                    name = d.name
                     # Only include devices that advertise a name and match our product
-                    if not d.name:
-                        _LOGGER.debug(
-                            "filtered out device (no name): address=%s",
-                            getattr(d, "address", None),
-                        )
+                    if not name:
+                        if debug:
+                            _LOGGER.debug(
+                                "filtered out device (no name): address=%s", addr
+                            )
                         continue
-                    try:
-                        if "animated skelly" not in d.name.lower():
+                    if not _SKELLY_RE.search(name):
+                        if debug:
                             _LOGGER.debug(
                                 "filtered out device (name mismatch): address=%s name=%s",
-                                getattr(d, "address", None),
-                                d.name,
+                                addr,
+                                name,
                             )
-                            continue
-                    except Exception:
-                        _LOGGER.exception(
-                            "Error examining device name: %s",
-                            getattr(d, "address", None),
-                        )
                         continue
 
-                    addr = d.address
-                    name = d.name
-                    display = f"{name} ({addr})" if name else addr
-                    choices[addr] = display
+                    choices[addr] = f"{name} ({addr})"
 
             # Offer an explicit "show all" choice in case the filtered
             # results aren't what the user expects. Selecting this will
             # route the flow to the unfiltered show_all branch.
-            choices[SHOW_ALL_TOKEN] = "Show all devices"
+            choices |= _SHOW_ALL_ENTRY
 
             # Save discovered mapping for the next step
             self._discovered = choices
@@ -420,19 +608,11 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
             if not choices:
                 # Nothing found; show a form allowing retry, show_all (fallback), or manual entry
-                schema = vol.Schema(
-                    {
-                        vol.Required("action", default="retry"): vol.In(
-                            ["retry", "show_all", "manual"]
-                        )
-                    }
-                )
-                return self.async_show_form(step_id="scan", data_schema=schema)
+                return self.async_show_form(step_id="scan", data_schema=_ACTION_SCHEMA)
 
-            schema = vol.Schema({vol.Required(CONF_ADDRESS): vol.In(choices)})
             return self.async_show_form(
                 step_id="scan",
-                data_schema=schema,
+                data_schema=_address_schema(choices),
                 description_placeholders={"count": str(len(choices))},
             )
 
@@ -440,7 +620,7 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         # unfiltered scan branch so we can present every device.
         if user_input is not None and CONF_ADDRESS in user_input:
             if user_input.get(CONF_ADDRESS) == SHOW_ALL_TOKEN:
-                return await self.async_step_scan({"action": "show_all"})
+                return await self._async_show_all()
 
         # user selected a device address
         address = user_input.get(CONF_ADDRESS)
@@ -449,23 +629,42 @@ class SkellyFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_abort(reason="no_devices_found")
 
         # Extract device name from discovered display string (format: "Name (Address)")
-        discovered_display = self._discovered.get(address) or address
-        # Try to extract name from "Name (Address)" format
-        if " (" in discovered_display and discovered_display.endswith(")"):
-            device_name = discovered_display.split(" (")[0]
-        else:
-            device_name = "Skelly Ultra"
+        device_name = _device_name_from_display(
+            self._discovered.get(address) or address
+        )
+        return self._create_entry(address, device_name)
 
-        # Build consistent title using helper
-        title = build_device_identifier(
-            device_name, address, self._server_url if self._use_ble_proxy else None
+
+class SkellyOptionsFlow(config_entries.OptionsFlow):
+    """Handle Skelly Ultra options."""
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None):
+        """Let the user tune the polling interval."""
+        if user_input is not None:
+            # Keep the connection switch states that are stored in the options too
+            return self.async_create_entry(
+                data={
+                    **self.config_entry.options,
+                    CONF_SCAN_INTERVAL: int(user_input[CONF_SCAN_INTERVAL]),
+                }
+            )
+
+        current = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
-        return self.async_create_entry(
-            title=title,
-            data={
-                CONF_ADDRESS: address,
-                CONF_NAME: device_name,
-                CONF_SERVER_URL: self._server_url,
-                CONF_USE_BLE_PROXY: self._use_ble_proxy,
-            },
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_SCAN_INTERVAL, default=current): NumberSelector(
+                        NumberSelectorConfig(
+                            min=MIN_SCAN_INTERVAL,
+                            max=MAX_SCAN_INTERVAL,
+                            step=10,
+                            unit_of_measurement="s",
+                            mode=NumberSelectorMode.SLIDER,
+                        )
+                    )
+                }
+            ),
         )
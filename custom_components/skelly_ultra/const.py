@@ -6,3 +6,9 @@ DOMAIN = "skelly_ultra"
 CONF_SERVER_URL = "server_url"
 CONF_USE_BLE_PROXY = "use_ble_proxy"
 DEFAULT_SERVER_URL = "http://localhost:8765"
+
+# Options flow constants
+CONF_SCAN_INTERVAL = "scan_interval"
+DEFAULT_SCAN_INTERVAL = 30
+MIN_SCAN_INTERVAL = 10
+MAX_SCAN_INTERVAL = 3600
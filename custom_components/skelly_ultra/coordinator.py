@@ -8,22 +8,156 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
 import time
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
-from typing import Any
+from functools import partial
+from typing import Any, Final
+
+from bleak.exc import BleakError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .client_adapter import SkellyClientAdapter
-from .const import DOMAIN
+from .client_adapter import SkellyClientAdapter, SkellyStatus
+from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
 from .helpers import DeviceLoggerAdapter
+from .skelly_ultra_pkg import parser
+from .skelly_ultra_pkg.file_transfer import FileTransferManager
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long a live mode connection confirmed by the REST server is trusted
+# before asking again; a new BLE connection always forces a fresh check
+_LIVE_MODE_CHECK_INTERVAL = 60.0
+
+# Deadline for one round of status queries, with extra time for the first poll
+_POLL_TIMEOUT: Final[float] = 15.0
+_INITIAL_POLL_TIMEOUT: Final[float] = 30.0
+
+# Chunk size shown when the MTU cannot be determined
+_DEFAULT_CHUNK_SIZE = 250
+
+# Window in which refresh requests are coalesced into one refresh
+_REFRESH_COOLDOWN = 0.5
+# Longest a requested refresh waits for in-flight writes to the device
+_WRITE_DRAIN_TIMEOUT = 2.0
+
+# Delay before retrying a poll that failed with a transient BLE error
+_POLL_RETRY_DELAY = 0.5
+
+# Keep serving the last good data for this long before entities go unavailable
+_STALE_DATA_GRACE = 300.0
+
+# Upper bound for the polling interval while backing off after failures
+_MAX_UPDATE_INTERVAL = timedelta(minutes=10)
+
+# Stretch the polling interval by this factor after each poll that changed
+# nothing, up to _MAX_IDLE_FACTOR times the configured scan interval; any
+# change restores the scan interval
+_IDLE_BACKOFF_FACTOR = 1.5
+_MAX_IDLE_FACTOR = 2
+
+
+_LIGHT_FIELDS = ("brightness", "rgb", "effect_type", "color_cycle", "effect_speed")
+_light_attrs = operator.attrgetter(*_LIGHT_FIELDS)
+
+
+def _light_to_dict(light: parser.LightInfo | None) -> dict[str, Any]:
+    """Convert a parsed light channel into the coordinator's light dict."""
+    if light is None:
+        return dict.fromkeys(_LIGHT_FIELDS)
+    try:
+        brightness, rgb, effect_type, color_cycle, effect_speed = _light_attrs(light)
+    except AttributeError:
+        return dict.fromkeys(_LIGHT_FIELDS)
+    return {
+        "brightness": int(brightness),
+        # The parser already produces tuples; only copy other sequences
+        "rgb": rgb if type(rgb) is tuple else tuple(rgb),
+        "effect_type": int(effect_type),
+        "color_cycle": int(color_cycle),
+        "effect_speed": int(effect_speed),
+    }
+
+
+def _normalize_capacity(
+    cap: parser.CapacityEvent | None,
+) -> tuple[int | None, int | None]:
+    """Return (capacity_kb, file_count) from a capacity response."""
+    if cap is None:
+        return None, None
+    return cap.capacity_kb, cap.file_count
+
+
+# Keys produced by a poll, each mapped to a bit in the optimistic-update mask
+_DATA_KEYS = (
+    "volume",
+    "live_name",
+    "capacity_kb",
+    "file_count_reported",
+    "file_count_received",
+    "mtu_chunk_size",
+    "eye_icon",
+    "action",
+    "file_order",
+    "pin_code",
+    "lights",
+)
+_KEY_BITS = {key: 1 << index for index, key in enumerate(_DATA_KEYS)}
+
+
+def _build_data(
+    status: SkellyStatus,
+    mtu_chunk_size: int,
+    file_count_received: int | None,
+) -> dict[str, Any]:
+    """Build the coordinator data dict from a polled device status.
+
+    This is plain CPU work with no I/O so it stays a synchronous function.
+    """
+    live_mode = status.live_mode
+    device_params = status.device_params
+
+    # Extract eye, action, and light info from the parsed live_mode event
+    eye = getattr(live_mode, "eye_icon", None)
+    action = getattr(live_mode, "action", None)
+    # live_mode.lights is a list of LightInfo objects; pad to the two channels
+    lights_list = getattr(live_mode, "lights", None) or ()
+    channels = (*lights_list, None, None)[:2]
+
+    # Extract capacity_kb and file_count_reported from CapacityEvent
+    capacity_kb, file_count_reported = _normalize_capacity(status.capacity)
+
+    # Extract pin_code from DeviceParamsEvent
+    pin_code = getattr(device_params, "pin_code", None) if device_params else None
+    if pin_code is not None:
+        pin_code = str(pin_code)
+
+    return {
+        "volume": status.volume,
+        "live_name": status.live_name,
+        "capacity_kb": capacity_kb,
+        "file_count_reported": file_count_reported,
+        "file_count_received": file_count_received,  # Preserve existing value
+        "mtu_chunk_size": mtu_chunk_size,  # MTU-based chunk size for display
+        # eye is expected to be an int (1-based) or None
+        "eye_icon": eye,
+        # action is a bitfield where bit 0 = head, bit 1 = arm, bit 2 = torso
+        "action": action,
+        # file_order is a list of integers representing playback order
+        "file_order": status.file_order,
+        # pin_code is the Bluetooth pairing PIN (e.g., "1234")
+        "pin_code": pin_code,
+        # lights is a list of small dicts with brightness, rgb, effect_type, color_cycle, and effect_speed
+        "lights": [_light_to_dict(light) for light in channels],
+    }
+
 
 class SkellyCoordinator(DataUpdateCoordinator):
     """Coordinator for the Skelly animatronic BLE device.
@@ -45,41 +179,170 @@ class SkellyCoordinator(DataUpdateCoordinator):
         device_logger: DeviceLoggerAdapter | None = None,
     ) -> None:
         """Initialize the coordinator and set polling interval."""
+        self._scan_interval = timedelta(
+            seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            update_interval=self._scan_interval,
+            # Only notify listeners when a poll actually changed something
+            always_update=False,
+            # Coalesce refresh requests into one delayed refresh instead of
+            # refreshing on the first request
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=_REFRESH_COOLDOWN, immediate=False
+            ),
         )
+        self._debounced_refresh.function = self._async_refresh_after_writes
         self.adapter = adapter
+        # Bind the methods used on every poll once instead of resolving
+        # adapter.client.<method> each time
+        client = adapter.client
+        self._get_status_bundle = adapter.get_status_bundle
+        self._get_live_mode_status = client.get_audio_status_live_mode
+        self._get_mtu_size = client.get_mtu_size
         self.action_lock = asyncio.Lock()
         self.device_info = device_info
         self._logger = device_logger or DeviceLoggerAdapter(
             _LOGGER, {"device_name": entry.title or "Skelly Ultra"}
         )
         self._is_initializing = True
-        self._last_refresh_request = 0.0
         self._updates_paused = False
-        self._file_list: list[Any] = []
+        # Set by async_refresh until its update runs
+        self._refresh_requested = False
+        # File information objects from the device, replaced (never mutated)
+        # by async_refresh_file_list
+        self.file_list: list[Any] = []
+        # File list the current file order and capacity belong to
+        self._status_file_list: list[Any] | None = None
         self._initial_update_done = False
-        self._data_counters: dict[str, int] = {}
+        # Bit mask of poll keys updated optimistically since the current poll started
+        self._dirty_mask = 0
+        self._mtu_chunk_size: int | None = None
         self._was_connected = False
         self._pending_state_push = False
+        # Coordinator data to restore on the device once a new connection is polled
+        self._state_to_push: dict[str, Any] | None = None
         self._pending_state_push_attempts = 0
+        self._fail_count = 0
+        self._last_success_ts = 0.0
+        # When live mode was last confirmed by the REST server; 0 forces a check
+        self._live_mode_verified_at = 0.0
+        adapter.client.register_parsed_notification_handler(self._handle_notification)
         self._logger.debug("SkellyCoordinator initialized for adapter: %s", adapter)
 
     def async_update_data_optimistic(self, key: str, value: Any) -> None:
-        """Update coordinator data optimistically and increment version counter.
+        """Update coordinator data optimistically and mark the key as dirty.
 
         This should be called by entities when they send a command to the device
         and want to update the state immediately without waiting for the next poll.
         """
-        self._data_counters[key] = self._data_counters.get(key, 0) + 1
+        self._dirty_mask |= _KEY_BITS.get(key, 0)
+        # Don't let a pending reconnect push undo a newer user change
+        if self._state_to_push is not None:
+            self._state_to_push = self._state_to_push | {key: value}
+        # A user action is likely to be followed by more changes
+        if not self._fail_count:
+            self.update_interval = self._scan_interval
+
+        self.async_set_updated_data((self.data or {}) | {key: value})
+
+    @callback
+    def _handle_notification(self, _sender: Any, event: Any) -> None:
+        """Apply volume and live name changes pushed by the device on its own.
+
+        Responses to the coordinator's own status queries are ignored here;
+        those are merged by the regular poll.
+        """
+        if self.data is None or self.adapter.status_query_in_progress:
+            return
+
+        if isinstance(event, parser.VolumeEvent):
+            key, value = "volume", event.volume
+        elif isinstance(event, parser.LiveNameEvent):
+            key, value = "live_name", event.name
+        else:
+            return
+
+        if self.data.get(key) != value:
+            self._logger.debug("Device pushed %s change: %s", key, value)
+            self.async_set_updated_data(self.data | {key: value})
+
+    @callback
+    def _async_apply_updates(self, updates: dict[str, Any]) -> None:
+        """Merge updates into the data, notifying listeners only on a change."""
+        if not self.data:
+            return
+        new_data = self.data | updates
+        if new_data != self.data:
+            self.async_set_updated_data(new_data)
+
+    def _record_update_failure(self) -> None:
+        """Back off the polling interval exponentially after a failed update."""
+        self._fail_count += 1
+        self.update_interval = min(
+            self._scan_interval * 2**self._fail_count,
+            max(self._scan_interval, _MAX_UPDATE_INTERVAL),
+        )
+        self._logger.debug(
+            "Update failed %d time(s) in a row - next poll in %s",
+            self._fail_count,
+            self.update_interval,
+        )
+
+    def _record_update_success(self, changed: bool) -> None:
+        """Adjust the polling interval after a successful update.
+
+        A poll that changed something, or the first success after failures,
+        restores the regular interval. Polls that keep finding the same state
+        back off gradually while the device sits idle.
+        """
+        self._last_success_ts = self.hass.loop.time()
+        if changed or self._fail_count:
+            self._fail_count = 0
+            self.update_interval = self._scan_interval
+            return
+        max_interval = self._scan_interval * _MAX_IDLE_FACTOR
+        if self.update_interval < max_interval:
+            self.update_interval = min(
+                self.update_interval * _IDLE_BACKOFF_FACTOR, max_interval
+            )
+            self._logger.debug(
+                "No changes detected - next poll in %s", self.update_interval
+            )
 
-        new_data = dict(self.data or {})
-        new_data[key] = value
+    @property
+    def last_success_age(self) -> float:
+        """Return the number of seconds since the last successful poll."""
+        return self.hass.loop.time() - self._last_success_ts
+
+    def _keep_data_or_fail(
+        self, message: str, cause: Exception | None = None
+    ) -> dict[str, Any]:
+        """Serve the last good data through short outages, else fail the update.
 
-        self.async_set_updated_data(new_data)
+        Returning cached data keeps last_update_success set, so entities stay
+        available during brief BLE drop-outs instead of flapping.
+        """
+        self._record_update_failure()
+        if self.data is not None and self.last_success_age < _STALE_DATA_GRACE:
+            self._logger.debug(
+                "%s - keeping data from %.0fs ago", message, self.last_success_age
+            )
+            return self.data
+        raise UpdateFailed(message) from cause
+
+    def set_scan_interval(self, seconds: int) -> None:
+        """Apply a new regular polling interval from the entry options."""
+        scan_interval = timedelta(seconds=seconds)
+        if scan_interval == self._scan_interval:
+            return
+        self._logger.debug("Polling interval changed to %s", scan_interval)
+        self._scan_interval = scan_interval
+        if not self._fail_count:
+            self.update_interval = scan_interval
 
     def notify_done_initializing(self) -> None:
         """Notifies the coordinator that device initialization started in async_setup_entry is done."""
@@ -102,13 +365,16 @@ class SkellyCoordinator(DataUpdateCoordinator):
         self._logger.info("Resuming coordinator updates")
         self._updates_paused = False
 
-    async def async_refresh_file_list(self) -> None:
+    async def async_refresh_file_list(self, refresh_status: bool = True) -> None:
         """Refresh the list of files from the device.
 
         This method fetches the current file list from the device and stores
         it in the coordinator. It can be called by both entities and services
         that need the latest file list information.
 
+        File order and capacity are re-read as well unless refresh_status is
+        False, which callers use when they have just polled both.
+
         Uses action_lock to prevent concurrent execution with coordinator updates.
         """
         # Check if we have a connection before attempting to fetch
@@ -119,88 +385,110 @@ class SkellyCoordinator(DataUpdateCoordinator):
         async with self.action_lock:
             self._logger.debug("Acquiring lock for file list refresh")
             try:
-                self._file_list = await self.adapter.client.get_file_list(timeout=20.0)
-                self._logger.debug("Loaded %d files from device", len(self._file_list))
-
-                # Also fetch file order and capacity to get updated device state
-                file_order = await self.adapter.client.get_file_order(timeout=5.0)
-                cap = await self.adapter.client.get_capacity(timeout=5.0)
-
-                # Extract capacity info
-                capacity_kb = getattr(cap, "capacity_kb", None) if cap else None
-                file_count_reported = getattr(cap, "file_count", None) if cap else None
-
-                # Update coordinator data with file list, order, and capacity
-                if self.data:
-                    updated_data = {
-                        **self.data,
-                        "file_count_received": len(self._file_list),
+                previous_list = self.file_list
+                self.file_list = await self.adapter.client.get_file_list(timeout=20.0)
+                self._logger.debug("Loaded %d files from device", len(self.file_list))
+
+                updates: dict[str, Any] = {"file_count_received": len(self.file_list)}
+                # File entries are dataclasses, so this compares every field
+                list_changed = self.file_list != self._status_file_list
+                # File order and capacity only change along with the file list
+                if refresh_status and (list_changed or self.data is None):
+                    # Also fetch file order and capacity to get updated device state
+                    file_order = await self.adapter.client.get_file_order(timeout=5.0)
+                    cap = await self.adapter.client.get_capacity(timeout=5.0)
+
+                    # Extract capacity info
+                    capacity_kb, file_count_reported = _normalize_capacity(cap)
+                    updates |= {
                         "file_order": file_order,
                         "capacity_kb": capacity_kb,
                         "file_count_reported": file_count_reported,
                     }
-                    self.async_set_updated_data(updated_data)
+                self._status_file_list = self.file_list
+
+                # Update coordinator data with file list, order, and capacity.
+                # Entities read the file list itself from the coordinator, so a
+                # list that differs from what they last saw notifies them even
+                # when the data is equal.
+                if self.file_list != previous_list and self.data:
+                    self.async_set_updated_data(self.data | updates)
+                else:
+                    self._async_apply_updates(updates)
             except TimeoutError:
                 self._logger.warning("Timeout loading file list from device")
-                self._file_list = []
-                if self.data:
-                    self.async_set_updated_data({**self.data, "file_count_received": 0})
+                self.file_list = []
+                self._status_file_list = None
+                self._async_apply_updates({"file_count_received": 0})
+            except BleakError as ex:
+                self._logger.warning("BLE error loading file list from device: %s", ex)
+                self.file_list = []
+                self._status_file_list = None
+                self._async_apply_updates({"file_count_received": 0})
             except Exception:
                 self._logger.exception("Failed to load file list from device")
-                self._file_list = []
-                if self.data:
-                    self.async_set_updated_data({**self.data, "file_count_received": 0})
+                self.file_list = []
+                self._status_file_list = None
+                self._async_apply_updates({"file_count_received": 0})
 
-    @property
-    def file_list(self) -> list[Any]:
-        """Return the current file list.
+    async def _async_refresh_after_writes(self) -> None:
+        """Refresh once pending writes have been sent to the device."""
+        if not await self.adapter.client.wait_for_writes_drained(_WRITE_DRAIN_TIMEOUT):
+            self._logger.debug(
+                "Writes still in flight after %.1fs, refreshing anyway",
+                _WRITE_DRAIN_TIMEOUT,
+            )
+        await self.async_refresh()
 
-        Returns:
-            list[Any]: List of file information objects from the device
+    async def async_refresh(self) -> None:
+        """Refresh now on request.
+
+        Unlike scheduled interval polls, a requested refresh waits for a busy
+        device action to finish instead of being skipped.
         """
-        return self._file_list
+        self._refresh_requested = True
+        await super().async_refresh()
 
     async def async_request_refresh(self, force_immediate: bool = False) -> None:
-        """Request a refresh with debouncing and delay.
+        """Request a debounced refresh.
 
-        Waits 2 seconds before actually refreshing to allow multiple rapid
-        changes to be sent to the device, then polls the final state.
+        Rapid requests are coalesced into a single refresh. The refresh runs
+        as soon as the writes to the device have completed, waiting at most 2
+        seconds for them. The caller is not blocked while waiting. With
+        force_immediate, any pending debounced refresh is cancelled and a
+        refresh runs now.
         """
-        now = time.monotonic()
-        time_since_last = now - self._last_refresh_request
-
-        # Debounce: ignore requests within 3 seconds of last request
-        if time_since_last < 3.0:
-            self._logger.debug(
-                "Ignoring refresh request - last request was %.3fs ago (debounce: 3.0s)",
-                time_since_last,
-            )
-            return
-
-        self._last_refresh_request = now
-
         if force_immediate:
             self._logger.debug("Requesting immediate coordinator refresh")
-        else:
-            self._logger.debug(
-                "Delaying coordinator refresh by 2s to allow changes to settle"
-            )
-
-            # Wait 2 seconds to give the device time to process the change
-            # and allow any rapid consecutive changes to complete
-            await asyncio.sleep(2.0)
-
-            self._logger.debug("Requesting coordinator refresh after delay")
+            self._debounced_refresh.async_cancel()
+            await self.async_refresh()
+            return
 
         await super().async_request_refresh()
 
-    async def _async_update_data(self) -> Any:
+    def _track_connection(self) -> None:
+        """Prepare the state push and reset per-connection caches on a new connection."""
+        connected = self.adapter.client.is_connected
         # Logic to ensure we push state to device on first connection or on reconnect after a disconnect
-        if not self._was_connected and self.adapter.client.is_connected:
+        if connected and not self._was_connected:
+            if not self._pending_state_push:
+                # The state to restore is what the coordinator held before
+                # the connection was (re)established
+                self._state_to_push = self.data
             self._pending_state_push = True
             self._pending_state_push_attempts = 0
+            # A new connection may have negotiated a different MTU, and live
+            # mode (possibly restored on connect) should be re-verified
+            self._mtu_chunk_size = None
+            self._live_mode_verified_at = 0.0
+        self._was_connected = connected
 
-        self._was_connected = self.adapter.client.is_connected
+    async def _async_update_data(self) -> Any:
+        client = self.adapter.client
+        requested = self._refresh_requested
+        self._refresh_requested = False
+        # Catch connections made outside the coordinator, e.g. by the Connected switch
+        self._track_connection()
 
         # Skip updates if paused (e.g., when Connected switch is off)
         if self._updates_paused:
@@ -209,173 +497,203 @@ class SkellyCoordinator(DataUpdateCoordinator):
                 "Device updates paused due to turned off Connected switch"
             )
 
-        if not self.adapter.client.is_connected:
+        if not client.is_connected:
             # Try to reconnect unless the device initialization is still running
             if not self._is_initializing:
                 self._logger.debug(
                     "Coordinator update with device not connected after initialization - attempting to re-connect"
                 )
                 await self.adapter.connect(attempts=1)
+                # Notice the new connection before this poll overwrites the
+                # data with what the device reports
+                self._track_connection()
 
-            if not self.adapter.client.is_connected:
+            if not client.is_connected:
                 self._logger.debug("Skipping coordinator update - device not connected")
-                raise UpdateFailed("Device not connected")
-
-        # Use action_lock to prevent concurrent execution with file list refresh
+                return self._keep_data_or_fail("Device not connected")
+
+        # Don't queue a scheduled poll behind a long-running device action such
+        # as a file list refresh; the next interval will poll again. Requested
+        # refreshes wait for the lock instead.
+        if not requested and self.action_lock.locked():
+            self._logger.debug("Another device action in progress - skipping poll")
+            if self.data is not None:
+                return self.data
+            raise UpdateFailed("Another action in progress, skipping poll")
+
+        try:
+            try:
+                result = await self._poll_once()
+            except (TimeoutError, BleakError) as ex:
+                # Retry transient BLE errors once before failing the update
+                self._logger.debug("Transient error polling device, retrying: %s", ex)
+                await asyncio.sleep(_POLL_RETRY_DELAY)
+                result = await self._poll_once()
+        except (TimeoutError, BleakError) as ex:
+            self._logger.warning("Skelly poll failed: %s", ex)
+            return self._keep_data_or_fail(f"Failed to update Skelly data: {ex}", ex)
+        except UpdateFailed:
+            self._record_update_failure()
+            raise
+        except Exception:
+            self._record_update_failure()
+            self._logger.exception("Coordinator update failed")
+            raise UpdateFailed("Failed to update Skelly data") from None
+
+        self._record_update_success(changed=result is not self.data)
+        return result
+
+    async def _poll_once(self) -> dict[str, Any]:
+        """Query the device once and merge the result into the coordinator data."""
+        client = self.adapter.client
+        # Only the device I/O needs mutual exclusion with the file list refresh
+        # and entity actions; building and merging the result runs lock-free.
         async with self.action_lock:
-            # Capture counters before starting the update to detect optimistic updates
-            # that happen while we are querying the device.
-            start_counters = self._data_counters.copy()
+            # Reset the dirty mask before starting the update to detect optimistic
+            # updates that happen while we are querying the device.
+            self._dirty_mask = 0
 
-            self._logger.debug("Coordinator polling Skelly device for updates")
+            debug = self._logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                self._logger.debug("Coordinator polling Skelly device for updates")
 
-            try:
-                # Query device state with staggered delays to avoid overwhelming the device.
-                # Each get_*() method sends its query and waits for the response.
-                # We stagger the calls by 50ms each to prevent command flooding.
-                # Use longer timeout for initial update to allow file list refresh to complete
-                timeout_seconds = 30.0 if not self._initial_update_done else 15.0
-                if not self._initial_update_done:
-                    self._logger.debug(
-                        "Initial update - using extended timeout of %s seconds",
-                        timeout_seconds,
+            # Use longer timeout for initial update to allow file list refresh to complete
+            timeout_seconds = (
+                _POLL_TIMEOUT if self._initial_update_done else _INITIAL_POLL_TIMEOUT
+            )
+            if not self._initial_update_done:
+                self._logger.debug(
+                    "Initial update - using extended timeout of %s seconds",
+                    timeout_seconds,
+                )
+            # On the first update, check for show mode with a single query
+            # before paying for the full status bundle
+            device_params = None
+            if self.data is None:
+                device_params = await client.get_device_params(timeout=5.0)
+                if getattr(device_params, "show_mode", None) == 1:
+                    self._logger.error(
+                        "Device is in SHOW MODE - This integration requires the device to be in normal mode. "
+                        "To switch out of show mode, hold the button on the Skelly device for about 10 seconds until it beeps."
                     )
-                try:
-                    async with asyncio.timeout(timeout_seconds):
-                        # Execute queries sequentially to avoid event queue race conditions.
-                        # When using asyncio.gather with shared event queue, multiple waiters
-                        # compete for the same events causing timeouts. Sequential execution
-                        # ensures each query gets its response before the next starts.
-                        live_mode = await self.adapter.client.get_live_mode(
-                            timeout=timeout_seconds
-                        )
-                        await asyncio.sleep(0.05)  # 50ms delay between queries
-
-                        device_params = await self.adapter.client.get_device_params(
-                            timeout=timeout_seconds
-                        )
-                        await asyncio.sleep(0.05)
-
-                        vol = await self.adapter.client.get_volume(
-                            timeout=timeout_seconds
-                        )
-                        await asyncio.sleep(0.05)
-
-                        live_name = await self.adapter.client.get_live_name(
-                            timeout=timeout_seconds
-                        )
-                        await asyncio.sleep(0.05)
-
-                        cap = await self.adapter.client.get_capacity(
-                            timeout=timeout_seconds
-                        )
-                        await asyncio.sleep(0.05)
+                    raise UpdateFailed("Device is in show mode")
+
+            loop = self.hass.loop
+
+            # Periodically check REST server status if we think live mode is
+            # connected. The REST server does not go through the BLE link, so
+            # the check runs while the status queries are in flight.
+            expected_mac = client.live_mode_client_address
+            now = time.monotonic()
+            rest_task = None
+            if (
+                expected_mac
+                and now - self._live_mode_verified_at > _LIVE_MODE_CHECK_INTERVAL
+            ):
+                self._logger.debug(
+                    "Coordinator checking REST server for live mode device: %s",
+                    expected_mac,
+                )
+                rest_task = self.hass.async_create_task(self._get_live_mode_status())
 
-                        file_order = await self.adapter.client.get_file_order(
-                            timeout=timeout_seconds
-                        )
-                except TimeoutError as ex:
-                    self._logger.warning(
-                        "Coordinator update timed out after %s seconds", timeout_seconds
-                    )
-                    raise UpdateFailed(
-                        f"Device polling timed out after {timeout_seconds}s"
-                    ) from ex
-
-                # Extract eye, action, and light info from the parsed live_mode event
-                eye = getattr(live_mode, "eye_icon", None)
-                action = getattr(live_mode, "action", None)
-                # live_mode.lights is a list of LightInfo objects
-                light0 = None
-                light1 = None
+            status: SkellyStatus | None = None
+            try:
+                # The adapter pipelines the status queries and the client routes
+                # each response to its own waiter. The overall deadline is a
+                # single call_later that cancels the task, which is cheaper
+                # than an asyncio.timeout cancel scope per poll.
+                status_task = loop.create_task(
+                    self._get_status_bundle(device_params=device_params)
+                )
+                deadline = loop.call_later(timeout_seconds, status_task.cancel)
                 try:
-                    lights_list = getattr(live_mode, "lights", []) or []
-                    if len(lights_list) > 0:
-                        light0 = lights_list[0]
-                    if len(lights_list) > 1:
-                        light1 = lights_list[1]
-                except Exception:
-                    light0 = None
-                    light1 = None
-
-                # Check REST server status if we think live mode is connected
-                expected_mac = self.adapter.client.live_mode_client_address
-                if expected_mac:
-                    self._logger.debug(
-                        "Coordinator checking REST server for live mode device: %s",
-                        expected_mac,
-                    )
-                    try:
-                        # Query REST server to verify connection is still active
-                        rest_status = (
-                            await self.adapter.client.get_audio_status_live_mode()
-                        )
+                    status = await status_task
+                except asyncio.CancelledError:
+                    # Only translate our own deadline into a timeout; an
+                    # outside cancellation must still propagate.
+                    if loop.time() < deadline.when():
+                        raise
+                    raise TimeoutError from None
+                finally:
+                    deadline.cancel()
+            except TimeoutError:
+                self._logger.debug(
+                    "Coordinator update timed out after %s seconds", timeout_seconds
+                )
+                raise
+            finally:
+                # Don't leave the REST check running when the poll failed
+                if rest_task is not None and status is None:
+                    if not rest_task.done():
+                        rest_task.cancel()
+                    elif not rest_task.cancelled():
+                        # Mark a REST failure as retrieved; the failed poll is
+                        # what gets reported
+                        rest_task.exception()
+
+            if rest_task is not None:
+                try:
+                    # Verify with the REST server that the connection is still active
+                    rest_status = await rest_task
 
-                        # Check if the REST server reports any connected devices
-                        bluetooth_info = rest_status.get("bluetooth", {})
-                        connected_devices = bluetooth_info.get("devices", [])
+                    # Check if the REST server reports any connected devices
+                    bluetooth_info = rest_status.get("bluetooth", {})
+                    connected_devices = bluetooth_info.get("devices", [])
 
+                    if debug:
                         self._logger.debug(
                             "REST server reports %d connected devices: %s",
                             len(connected_devices),
                             connected_devices,
                         )
 
-                        # Look for our expected MAC address in the connected devices
-                        # Use case-insensitive comparison since MAC addresses can vary in case
-                        expected_mac_lower = expected_mac.lower()
-                        mac_still_connected = any(
-                            device.get("mac", "").lower() == expected_mac_lower
-                            for device in connected_devices
-                        )
+                    # Look for our expected MAC address in the connected devices
+                    # Use case-insensitive comparison since MAC addresses can vary in case
+                    connected_macs = frozenset(
+                        device.get("mac", "").lower() for device in connected_devices
+                    )
+                    mac_still_connected = expected_mac.lower() in connected_macs
 
-                        if not mac_still_connected:
-                            self._logger.warning(
-                                "Live mode device %s is no longer connected to REST server, cleaning up",
-                                expected_mac,
-                            )
-                            # Disconnect on our side to sync state
-                            await self.adapter.disconnect_live_mode()
-
-                            # If user prefers live mode on, attempt to restore it
-                            if self.adapter.live_mode_should_connect:
-                                await self.adapter.restore_live_mode_if_needed()
-                        else:
-                            self._logger.debug(
-                                "Live mode device %s is still connected to REST server",
-                                expected_mac,
-                            )
-
-                    except Exception as ex:
-                        # REST server may be down or unreachable
+                    if not mac_still_connected:
                         self._logger.warning(
-                            "Failed to check REST server status for live mode device %s: %s. Assuming disconnected",
+                            "Live mode device %s is no longer connected to REST server, cleaning up",
                             expected_mac,
-                            ex,
                         )
-                        # Clean up our state since we can't verify the connection
+                        # Disconnect on our side to sync state
                         await self.adapter.disconnect_live_mode()
 
-                # Extract capacity_kb and file_count_reported from CapacityEvent
-                capacity_kb = getattr(cap, "capacity_kb", None) if cap else None
-                file_count_reported = getattr(cap, "file_count", None) if cap else None
-
-                # Preserve existing file_count_received value if already set
-                # (it's only updated by async_refresh_file_list, not by regular polling)
-                existing_file_count_received = (
-                    self.data.get("file_count_received") if self.data else None
-                )
+                        # If user prefers live mode on, attempt to restore it
+                        if self.adapter.live_mode_should_connect:
+                            await self.adapter.restore_live_mode_if_needed()
+                    else:
+                        self._live_mode_verified_at = now
+                        self._logger.debug(
+                            "Live mode device %s is still connected to REST server",
+                            expected_mac,
+                        )
 
-                # Calculate MTU-based chunk size for display in number entity
-                mtu_chunk_size = 250  # Default
+                except Exception as ex:
+                    # REST server may be down or unreachable
+                    self._logger.warning(
+                        "Failed to check REST server status for live mode device %s: %s. Assuming disconnected",
+                        expected_mac,
+                        ex,
+                    )
+                    # Clean up our state since we can't verify the connection
+                    await self.adapter.disconnect_live_mode()
+
+            # Calculate MTU-based chunk size for display in number entity. The MTU
+            # only changes with a new connection, so it is cached until then.
+            mtu_chunk_size = self._mtu_chunk_size
+            if mtu_chunk_size is None:
+                mtu_chunk_size = _DEFAULT_CHUNK_SIZE
                 try:
-                    mtu = await self.adapter.client.get_mtu_size()
+                    mtu = await self._get_mtu_size()
                     if mtu and mtu > 0:
-                        from .skelly_ultra_pkg.file_transfer import FileTransferManager
-
                         mtu_chunk_size = (
                             FileTransferManager.calculate_chunk_size_from_mtu(mtu)
                         )
+                        self._mtu_chunk_size = mtu_chunk_size
                         self._logger.debug(
                             "Calculated MTU-based chunk size: %d bytes (MTU: %d)",
                             mtu_chunk_size,
@@ -387,230 +705,226 @@ class SkellyCoordinator(DataUpdateCoordinator):
                         mtu_chunk_size,
                     )
 
-                # Extract pin_code and show_mode from DeviceParamsEvent
-                pin_code = (
-                    getattr(device_params, "pin_code", None) if device_params else None
-                )
-                if pin_code is not None:
-                    pin_code = str(pin_code)
-                show_mode = (
-                    getattr(device_params, "show_mode", None) if device_params else None
-                )
-
-                # Check if device is in show mode (show_mode=1) on initial update
-                if show_mode == 1 and self.data is None:
-                    self._logger.error(
-                        "Device is in SHOW MODE - This integration requires the device to be in normal mode. "
-                        "To switch out of show mode, hold the button on the Skelly device for about 10 seconds until it beeps."
-                    )
+        # Preserve existing file_count_received value if already set
+        # (it's only updated by async_refresh_file_list, not by regular polling)
+        existing_file_count_received = (
+            self.data.get("file_count_received") if self.data else None
+        )
 
-                data = {
-                    "volume": vol,
-                    "live_name": live_name,
-                    "capacity_kb": capacity_kb,
-                    "file_count_reported": file_count_reported,
-                    "file_count_received": existing_file_count_received,  # Preserve existing value
-                    "mtu_chunk_size": mtu_chunk_size,  # MTU-based chunk size for display
-                    # eye is expected to be an int (1-based) or None
-                    "eye_icon": eye,
-                    # action is a bitfield where bit 0 = head, bit 1 = arm, bit 2 = torso
-                    "action": action,
-                    # file_order is a list of integers representing playback order
-                    "file_order": file_order,
-                    # pin_code is the Bluetooth pairing PIN (e.g., "1234")
-                    "pin_code": pin_code,
-                    # lights is a list of small dicts with brightness, rgb, effect_type, color_cycle, and effect_speed
-                    "lights": [
-                        {
-                            "brightness": int(getattr(light0, "brightness", 0))
-                            if light0 is not None
-                            else None,
-                            "rgb": tuple(getattr(light0, "rgb", (0, 0, 0)))
-                            if light0 is not None
-                            else None,
-                            "effect_type": int(getattr(light0, "effect_type", 1))
-                            if light0 is not None
-                            else None,
-                            "color_cycle": int(getattr(light0, "color_cycle", 0))
-                            if light0 is not None
-                            else None,
-                            "effect_speed": int(getattr(light0, "effect_speed", 0))
-                            if light0 is not None
-                            else None,
-                        },
-                        {
-                            "brightness": int(getattr(light1, "brightness", 0))
-                            if light1 is not None
-                            else None,
-                            "rgb": tuple(getattr(light1, "rgb", (0, 0, 0)))
-                            if light1 is not None
-                            else None,
-                            "effect_type": int(getattr(light1, "effect_type", 1))
-                            if light1 is not None
-                            else None,
-                            "color_cycle": int(getattr(light1, "color_cycle", 0))
-                            if light1 is not None
-                            else None,
-                            "effect_speed": int(getattr(light1, "effect_speed", 0))
-                            if light1 is not None
-                            else None,
-                        },
-                    ],
-                }
-                self._logger.debug("Coordinator fetched data: %s", data)
-
-                # On initial update, also fetch the file list
-                if not self._initial_update_done:
-                    self._logger.debug("Initial update - refreshing file list")
-                    self._initial_update_done = True
-                    # Schedule file list refresh as background task to not block coordinator update
-                    self.hass.async_create_task(self.async_refresh_file_list())
-
-                # Merge fetched data with existing data, respecting optimistic updates
-                result_data = dict(self.data or {})
-                optimistic_update_occurred = False
-
-                for key, value in data.items():
-                    current_counter = self._data_counters.get(key, 0)
-                    start_counter = start_counters.get(key, 0)
-
-                    if current_counter == start_counter:
-                        # No optimistic update occurred for this key, use fetched value
-                        result_data[key] = value
-                        # Increment counter to mark this as a new version
-                        self._data_counters[key] = current_counter + 1
-                    else:
-                        # Optimistic update occurred, discard fetched value and keep existing
-                        optimistic_update_occurred = True
-                        self._logger.debug(
-                            "Optimistic update detected for key %s (counter %d != %d), discarding fetched value",
-                            key,
-                            current_counter,
-                            start_counter,
-                        )
+        data = _build_data(status, mtu_chunk_size, existing_file_count_received)
+        if debug:
+            self._logger.debug("Coordinator fetched data: %s", data)
+
+        # On initial update, also fetch the file list
+        if not self._initial_update_done:
+            self._logger.debug("Initial update - refreshing file list")
+            self._initial_update_done = True
+            # Schedule file list refresh as background task to not block coordinator update.
+            # File order and capacity were just polled, so don't query them again.
+            self.hass.async_create_task(
+                self.async_refresh_file_list(refresh_status=False)
+            )
 
-                if optimistic_update_occurred:
+        # Merge fetched data with existing data, respecting optimistic updates
+        dirty_mask = self._dirty_mask
+        optimistic_update_occurred = bool(dirty_mask)
+        needs_reconcile = False
+        if optimistic_update_occurred:
+            result_data = dict(self.data or {})
+            for key, value in data.items():
+                if dirty_mask & _KEY_BITS[key]:
+                    # Optimistic update occurred, discard fetched value and keep existing.
+                    # Only reconcile when the device reports something different.
+                    differs = result_data.get(key) != value
+                    needs_reconcile |= differs
                     self._logger.debug(
-                        "Optimistic updates occurred during poll, scheduling immediate refresh"
-                    )
-                    # Schedule another refresh to get the authoritative state
-                    # We use a task to avoid blocking the current update completion
-                    self.hass.async_create_task(
-                        self.async_request_refresh(force_immediate=True)
+                        "Optimistic update detected for key %s, discarding fetched value (reconcile: %s)",
+                        key,
+                        differs,
                     )
+                else:
+                    result_data[key] = value
+        else:
+            # No optimistic updates occurred, use all fetched values
+            result_data = self.data | data if self.data else data
 
-                if (
-                    not optimistic_update_occurred
-                    and self._pending_state_push
-                    and self.adapter.client.is_connected
-                ):
-                    try:
-                        await self._async_push_state_to_device(result_data)
-                        self._pending_state_push = False
-                        self._pending_state_push_attempts = 0
-                        self._logger.debug(
-                            "Finished pushing coordinator state to device after connection"
-                        )
-                    except Exception:
-                        self._pending_state_push_attempts += 1
-                        self._logger.exception(
-                            "Failed to push coordinator state to device (attempt %d)",
-                            self._pending_state_push_attempts,
+        if needs_reconcile:
+            self._logger.debug(
+                "Optimistic updates differ from device state, scheduling immediate refresh"
+            )
+            # Schedule another refresh to get the authoritative state
+            # We use a task to avoid blocking the current update completion
+            self.hass.async_create_task(
+                self.async_request_refresh(force_immediate=True)
+            )
+
+        if (
+            not optimistic_update_occurred
+            and self._pending_state_push
+            and client.is_connected
+        ):
+            try:
+                # Nothing to restore on the very first connection
+                if self._state_to_push is not None:
+                    # Pushing state is device I/O again, so it takes the lock
+                    async with self.action_lock:
+                        sent = await self._async_push_state_to_device(
+                            self._state_to_push, data
                         )
-                        # Keep pending flag true to retry on the next successful update
+                    if sent:
+                        # Read back what the device accepted
+                        self.hass.async_create_task(self.async_request_refresh())
+                self._pending_state_push = False
+                self._state_to_push = None
+                self._pending_state_push_attempts = 0
+                self._logger.debug(
+                    "Finished pushing coordinator state to device after connection"
+                )
+            except (TimeoutError, BleakError) as ex:
+                self._pending_state_push_attempts += 1
+                self._logger.warning(
+                    "Failed to push coordinator state to device (attempt %d): %s",
+                    self._pending_state_push_attempts,
+                    ex,
+                )
+                # Keep pending flag true to retry on the next successful update
+            except Exception:
+                self._pending_state_push_attempts += 1
+                self._logger.exception(
+                    "Failed to push coordinator state to device (attempt %d)",
+                    self._pending_state_push_attempts,
+                )
+                # Keep pending flag true to retry on the next successful update
 
-                return result_data
+        if result_data == self.data:
+            # Unchanged poll: hand back the existing object so nothing
+            # downstream sees a new state
+            return self.data
+        return result_data
 
-            except Exception:
-                self._logger.exception("Coordinator update failed")
-                raise UpdateFailed("Failed to update Skelly data") from None
-            else:
-                return data
+    async def _async_push_state_to_device(
+        self, desired: dict[str, Any], current: dict[str, Any]
+    ) -> int:
+        """Push selected coordinator state back to the device after connection.
+
+        ``desired`` is the coordinator state from before the connection was
+        (re)established. Only fields whose desired value differs from the
+        state the device just reported in ``current`` are written.
 
-    async def _async_push_state_to_device(self, state: dict[str, Any]) -> None:
-        """Push selected coordinator state back to the device after connection."""
+        Returns the number of writes sent.
+        """
 
         # Skip if we don't have a connection to write to
         if not self.adapter.client.is_connected:
             self._logger.debug("Skipping state push - client not connected")
-            return
+            return 0
 
-        volume = state.get("volume")
-        if volume is not None:
-            try:
-                await self.adapter.client.set_volume(int(volume))
-            except Exception:
-                self._logger.debug("Failed to push volume to device", exc_info=True)
+        client = self.adapter.client
+        # Collect the writes first and send them one at a time afterwards, so
+        # the device is not flooded and a bad value fails before any write
+        writes: list[tuple[str, Callable[[], Awaitable[None]]]] = []
+        skipped = 0
 
-        eye_icon = state.get("eye_icon")
-        if eye_icon is not None:
-            try:
-                await self.adapter.client.set_eye_icon(int(eye_icon))
-            except Exception:
-                self._logger.debug("Failed to push eye icon to device", exc_info=True)
+        volume = desired.get("volume")
+        if volume is not None and volume != current.get("volume"):
+            writes.append(("volume", partial(client.set_volume, int(volume))))
+        else:
+            skipped += 1
 
-        action = state.get("action")
-        if action is not None:
-            try:
-                await self.adapter.client.set_action(int(action))
-            except Exception:
-                self._logger.debug(
-                    "Failed to push action bitfield to device", exc_info=True
-                )
+        eye_icon = desired.get("eye_icon")
+        if eye_icon is not None and eye_icon != current.get("eye_icon"):
+            writes.append(("eye icon", partial(client.set_eye_icon, int(eye_icon))))
+        else:
+            skipped += 1
+
+        action = desired.get("action")
+        if action is not None and action != current.get("action"):
+            writes.append(("action bitfield", partial(client.set_action, int(action))))
+        else:
+            skipped += 1
 
-        lights = state.get("lights") or []
-        for index, light_state in enumerate(lights):
+        current_lights = current.get("lights") or []
+        for index, light_state in enumerate(desired.get("lights") or []):
             if not isinstance(light_state, dict):
                 continue
+            device_light = (
+                current_lights[index] if index < len(current_lights) else None
+            )
+            if not isinstance(device_light, dict):
+                device_light = {}
 
             rgb = light_state.get("rgb")
             color_cycle = light_state.get("color_cycle")
-            if rgb is not None:
-                try:
-                    r, g, b = (int(rgb[0]), int(rgb[1]), int(rgb[2]))
-                    await self.adapter.client.set_light_rgb(
-                        index,
-                        r,
-                        g,
-                        b,
-                        int(color_cycle) if color_cycle is not None else 0,
-                    )
-                except Exception:
-                    self._logger.debug(
-                        "Failed to push RGB for light channel %d", index, exc_info=True
+            if rgb is not None and (
+                rgb != device_light.get("rgb")
+                or color_cycle != device_light.get("color_cycle")
+            ):
+                writes.append(
+                    (
+                        f"RGB for light channel {index}",
+                        partial(
+                            client.set_light_rgb,
+                            index,
+                            int(rgb[0]),
+                            int(rgb[1]),
+                            int(rgb[2]),
+                            int(color_cycle) if color_cycle is not None else 0,
+                        ),
                     )
+                )
+            else:
+                skipped += 1
 
             brightness = light_state.get("brightness")
-            if brightness is not None:
-                try:
-                    await self.adapter.client.set_light_brightness(
-                        index, int(brightness)
-                    )
-                except Exception:
-                    self._logger.debug(
-                        "Failed to push brightness for light channel %d",
-                        index,
-                        exc_info=True,
+            if brightness is not None and brightness != device_light.get("brightness"):
+                writes.append(
+                    (
+                        f"brightness for light channel {index}",
+                        partial(client.set_light_brightness, index, int(brightness)),
                     )
+                )
+            else:
+                skipped += 1
 
             effect_type = light_state.get("effect_type")
-            if effect_type is not None:
-                try:
-                    await self.adapter.client.set_light_mode(index, int(effect_type))
-                except Exception:
-                    self._logger.debug(
-                        "Failed to push effect mode for light channel %d",
-                        index,
-                        exc_info=True,
+            if effect_type is not None and effect_type != device_light.get(
+                "effect_type"
+            ):
+                writes.append(
+                    (
+                        f"effect mode for light channel {index}",
+                        partial(client.set_light_mode, index, int(effect_type)),
                     )
+                )
+            else:
+                skipped += 1
 
             effect_speed = light_state.get("effect_speed")
-            if effect_speed is not None:
-                try:
-                    await self.adapter.client.set_light_speed(index, int(effect_speed))
-                except Exception:
-                    self._logger.debug(
-                        "Failed to push effect speed for light channel %d",
-                        index,
-                        exc_info=True,
+            if effect_speed is not None and effect_speed != device_light.get(
+                "effect_speed"
+            ):
+                writes.append(
+                    (
+                        f"effect speed for light channel {index}",
+                        partial(client.set_light_speed, index, int(effect_speed)),
                     )
+                )
+            else:
+                skipped += 1
+
+        for label, write in writes:
+            try:
+                await write()
+            except (TimeoutError, BleakError) as ex:
+                # Reconnect jitter; not worth a traceback
+                self._logger.debug("Failed to push %s to device: %s", label, ex)
+            except Exception:
+                self._logger.debug("Failed to push %s to device", label, exc_info=True)
+        sent = len(writes)
+
+        self._logger.debug(
+            "State push sent %d change(s), skipped %d unchanged field(s)",
+            sent,
+            skipped,
+        )
+        return sent
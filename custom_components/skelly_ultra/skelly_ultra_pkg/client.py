@@ -13,6 +13,21 @@ from . import commands, parser
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between query commands sent to the device, in seconds
+QUERY_SEND_SPACING = 0.05
+
+# Responses to status queries. They are handed to the query waiting for them;
+# unclaimed ones (late replies, changes the device pushes on its own) only go
+# to the parsed notification handler, since nothing reads them from the queue.
+QUERY_RESPONSE_TYPES = (
+    parser.VolumeEvent,
+    parser.LiveNameEvent,
+    parser.LiveModeEvent,
+    parser.CapacityEvent,
+    parser.FileOrderEvent,
+    parser.DeviceParamsEvent,
+)
+
 
 class SkellyClient:
     def __init__(
@@ -33,6 +48,15 @@ class SkellyClient:
         )
         self._parsed_handler: Callable[[Any, Any], None] | None = None
         self.events: asyncio.Queue = asyncio.Queue()
+        # Pending query responses, resolved directly from the notification
+        # callback so concurrent queries never consume each other's events
+        self._pending_queries: list[tuple[Callable[[Any], bool], asyncio.Future]] = []
+        self._query_send_lock = asyncio.Lock()
+        self._last_query_send = 0.0
+        # Command writes currently in flight; the event is set when there are none
+        self._writes_in_flight = 0
+        self._writes_drained = asyncio.Event()
+        self._writes_drained.set()
         self._rest_session: aiohttp.ClientSession | None = None
         # BLE proxy mode tracking
         self._ble_session_id: str | None = None
@@ -103,10 +127,11 @@ class SkellyClient:
                 device = await BleakScanner.find_device_by_address(self.address)
             else:
                 devices = await BleakScanner.discover(timeout=timeout)
-                for d in devices:
-                    if d.name and self.name_filter.lower() in d.name.lower():
-                        device = d
-                        break
+                name_filter = self.name_filter.casefold()
+                device = next(
+                    (d for d in devices if d.name and name_filter in d.name.casefold()),
+                    None,
+                )
 
             if not device:
                 return False
@@ -153,12 +178,15 @@ class SkellyClient:
             try:
                 parsed = parser.parse_notification(sender, data)
                 if parsed is not None:
-                    # push into events queue
-                    try:
-                        self.events.put_nowait(parsed)
-                        logger.debug("Parsed event queued: %s", parsed)
-                    except asyncio.QueueFull:
-                        pass
+                    # answer a pending query or push into events queue
+                    if self._resolve_pending_query(parsed):
+                        logger.debug("Parsed event answered pending query: %s", parsed)
+                    elif not isinstance(parsed, QUERY_RESPONSE_TYPES):
+                        try:
+                            self.events.put_nowait(parsed)
+                            logger.debug("Parsed event queued: %s", parsed)
+                        except asyncio.QueueFull:
+                            pass
                     if self._parsed_handler:
                         with contextlib.suppress(Exception):
                             self._parsed_handler(sender, parsed)
@@ -431,15 +459,41 @@ class SkellyClient:
         return self._live_mode_client_address
 
     async def send_command(self, cmd_bytes: bytes) -> None:
+        """Send a command, tracking it as in flight until the write completes."""
+        self._writes_in_flight += 1
+        self._writes_drained.clear()
+        try:
+            await self._send_command(cmd_bytes)
+        finally:
+            self._writes_in_flight -= 1
+            if not self._writes_in_flight:
+                self._writes_drained.set()
+
+    async def wait_for_writes_drained(self, timeout: float) -> bool:
+        """Wait until no command writes are in flight.
+
+        Returns False if writes were still in flight when the timeout expired.
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                await self._writes_drained.wait()
+        except TimeoutError:
+            return False
+        return True
+
+    async def _send_command(self, cmd_bytes: bytes) -> None:
         if not self.is_connected:
             raise RuntimeError("Not connected")
 
-        # Log raw outgoing bytes as a space-separated hex string for debugging
-        try:
-            raw_hex = " ".join(f"{b:02X}" for b in cmd_bytes)
-        except Exception:
-            raw_hex = cmd_bytes.hex().upper()
-        logger.debug("[RAW SEND] (%d bytes): %s", len(cmd_bytes), raw_hex)
+        # Log raw outgoing bytes as a space-separated hex string for debugging.
+        # Only build the string when it will be logged; file transfers send
+        # many large chunks.
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                raw_hex = " ".join(f"{b:02X}" for b in cmd_bytes)
+            except Exception:
+                raw_hex = cmd_bytes.hex().upper()
+            logger.debug("[RAW SEND] (%d bytes): %s", len(cmd_bytes), raw_hex)
 
         # Route via BLE proxy if enabled
         if self.use_ble_proxy:
@@ -745,6 +799,45 @@ class SkellyClient:
         await self.send_command(commands.set_music_animation(action, cluster, filename))
 
     # Awaitable helpers that send a query and wait for a matching parsed event
+    def _resolve_pending_query(self, event: Any) -> bool:
+        """Hand a parsed event to the oldest pending query that matches it.
+
+        Returns True if the event was consumed by a query.
+        """
+        for index, (predicate, future) in enumerate(self._pending_queries):
+            if not future.done() and predicate(event):
+                del self._pending_queries[index]
+                future.set_result(event)
+                return True
+        return False
+
+    async def _query(self, cmd_bytes: bytes, predicate, timeout: float | None = 2.0):
+        """Send a query command and await the first matching response.
+
+        The response future is registered before the command is sent, so
+        queries can be issued concurrently: each response is routed to its own
+        waiter by the notification callback. Query sends are paced
+        QUERY_SEND_SPACING seconds apart to avoid flooding the device.
+
+        A timeout of None waits without a timer of its own, for callers that
+        already bound a batch of queries with one deadline.
+        """
+        loop = asyncio.get_running_loop()
+        pending = (predicate, loop.create_future())
+        self._pending_queries.append(pending)
+        try:
+            async with asyncio.timeout(timeout):
+                async with self._query_send_lock:
+                    delay = QUERY_SEND_SPACING - (loop.time() - self._last_query_send)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    await self.send_command(cmd_bytes)
+                    self._last_query_send = loop.time()
+                return await pending[1]
+        finally:
+            with contextlib.suppress(ValueError):
+                self._pending_queries.remove(pending)
+
     async def _wait_for_event(self, predicate, timeout: float = 2.0):
         """Wait for an event from self.events that matches predicate.
 
@@ -775,27 +868,27 @@ class SkellyClient:
                 with contextlib.suppress(Exception):
                     self.events.put_nowait(e)
 
-    async def get_volume(self, timeout: float = 2.0) -> int:
+    async def get_volume(self, timeout: float | None = 2.0) -> int:
         """Query volume and await a VolumeEvent; returns the numeric volume."""
-        await self.send_command(commands.query_volume())
-        ev = await self._wait_for_event(
+        ev = await self._query(
+            commands.query_volume(),
             lambda e: isinstance(e, parser.VolumeEvent),
             timeout=timeout,
         )
         return ev.volume
 
-    async def get_live_name(self, timeout: float = 2.0) -> str:
+    async def get_live_name(self, timeout: float | None = 2.0) -> str:
         """Query the live name and await a LiveNameEvent; returns the name string."""
-        await self.send_command(commands.query_live_name())
-        ev = await self._wait_for_event(
+        ev = await self._query(
+            commands.query_live_name(),
             lambda e: isinstance(e, parser.LiveNameEvent),
             timeout=timeout,
         )
         return ev.name
 
-    async def get_file_order(self, timeout: float = 2.0) -> list[int]:
-        await self.send_command(commands.query_file_order())
-        ev = await self._wait_for_event(
+    async def get_file_order(self, timeout: float | None = 2.0) -> list[int]:
+        ev = await self._query(
+            commands.query_file_order(),
             lambda e: isinstance(e, parser.FileOrderEvent),
             timeout=timeout,
         )
@@ -803,17 +896,17 @@ class SkellyClient:
 
     async def get_eye_icon(self, timeout: float = 2.0) -> int:
         """Query the device live mode and return the eye_icon integer."""
-        await self.send_command(commands.query_live_mode())
-        ev = await self._wait_for_event(
+        ev = await self._query(
+            commands.query_live_mode(),
             lambda e: isinstance(e, parser.LiveModeEvent),
             timeout=timeout,
         )
         return ev.eye_icon
 
-    async def get_live_mode(self, timeout: float = 2.0) -> parser.LiveModeEvent:
+    async def get_live_mode(self, timeout: float | None = 2.0) -> parser.LiveModeEvent:
         """Query the device live mode and return the parsed LiveModeEvent."""
-        await self.send_command(commands.query_live_mode())
-        return await self._wait_for_event(
+        return await self._query(
+            commands.query_live_mode(),
             lambda e: isinstance(e, parser.LiveModeEvent),
             timeout=timeout,
         )
@@ -828,8 +921,8 @@ class SkellyClient:
         Channel is zero-based and valid values are 0..5. Raises IndexError if
         the channel is out of range.
         """
-        await self.send_command(commands.query_live_mode())
-        ev = await self._wait_for_event(
+        ev = await self._query(
+            commands.query_live_mode(),
             lambda e: isinstance(e, parser.LiveModeEvent),
             timeout=timeout,
         )
@@ -838,21 +931,23 @@ class SkellyClient:
             raise IndexError("Channel out of range")
         return lights[channel]
 
-    async def get_capacity(self, timeout: float = 2.0) -> parser.CapacityEvent:
-        await self.send_command(commands.query_capacity())
-        return await self._wait_for_event(
+    async def get_capacity(self, timeout: float | None = 2.0) -> parser.CapacityEvent:
+        return await self._query(
+            commands.query_capacity(),
             lambda e: isinstance(e, parser.CapacityEvent),
             timeout=timeout,
         )
 
-    async def get_device_params(self, timeout: float = 2.0) -> parser.DeviceParamsEvent:
+    async def get_device_params(
+        self, timeout: float | None = 2.0
+    ) -> parser.DeviceParamsEvent:
         """Query device parameters including PIN code, WiFi password, and channels.
 
         Returns:
             DeviceParamsEvent with device configuration parameters.
         """
-        await self.send_command(commands.query_device_params())
-        return await self._wait_for_event(
+        return await self._query(
+            commands.query_device_params(),
             lambda e: isinstance(e, parser.DeviceParamsEvent),
             timeout=timeout,
         )
@@ -1198,16 +1293,17 @@ class SkellyClient:
                             sender = notif["sender"]
 
                             # Log raw incoming bytes
-                            try:
-                                raw_hex = " ".join(f"{b:02X}" for b in raw_data)
-                            except Exception:
-                                raw_hex = raw_data.hex().upper()
-                            logger.debug(
-                                "[RAW RECV] (%d bytes) from %s: %s",
-                                len(raw_data),
-                                sender,
-                                raw_hex,
-                            )
+                            if logger.isEnabledFor(logging.DEBUG):
+                                try:
+                                    raw_hex = " ".join(f"{b:02X}" for b in raw_data)
+                                except Exception:
+                                    raw_hex = raw_data.hex().upper()
+                                logger.debug(
+                                    "[RAW RECV] (%d bytes) from %s: %s",
+                                    len(raw_data),
+                                    sender,
+                                    raw_hex,
+                                )
 
                             # Call notification handler (if registered)
                             if self._notification_handler:
@@ -1218,11 +1314,19 @@ class SkellyClient:
                             try:
                                 parsed = parser.parse_notification(sender, raw_data)
                                 if parsed is not None:
-                                    try:
-                                        self.events.put_nowait(parsed)
-                                        logger.debug("Parsed event queued: %s", parsed)
-                                    except asyncio.QueueFull:
-                                        pass
+                                    if self._resolve_pending_query(parsed):
+                                        logger.debug(
+                                            "Parsed event answered pending query: %s",
+                                            parsed,
+                                        )
+                                    elif not isinstance(parsed, QUERY_RESPONSE_TYPES):
+                                        try:
+                                            self.events.put_nowait(parsed)
+                                            logger.debug(
+                                                "Parsed event queued: %s", parsed
+                                            )
+                                        except asyncio.QueueFull:
+                                            pass
                                     if self._parsed_handler:
                                         with contextlib.suppress(Exception):
                                             self._parsed_handler(sender, parsed)